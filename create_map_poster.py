@@ -9,12 +9,17 @@ high-quality poster-ready images with roads, water features, and parks.
 
 import argparse
 import asyncio
+import importlib.util
 import json
 import os
 import pickle
 import sys
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import cast
 
@@ -22,16 +27,28 @@ import matplotlib.colors as mcolors
 import matplotlib.pyplot as plt
 import numpy as np
 import osmnx as ox
-from geopandas import GeoDataFrame
+import pandas as pd
+import shapely
+from geopandas import GeoDataFrame, clip, read_parquet
 from geopy.geocoders import Nominatim
 from lat_lon_parser import parse
+from matplotlib.collections import LineCollection, PathCollection
 from matplotlib.font_manager import FontProperties
+from matplotlib.path import Path as MplPath
 from networkx import MultiDiGraph
-from shapely.geometry import Point
+from shapely.geometry import Point, box
 from tqdm import tqdm
 
 from font_management import load_fonts
 
+try:
+    import zstandard
+except ImportError:  # Optional: caches are stored uncompressed without it
+    zstandard = None  # type: ignore[assignment]
+
+# GeoParquet caching needs pyarrow; probe without importing it
+PARQUET_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
 
 class CacheError(Exception):
     """Raised when a cache operation fails."""
@@ -41,6 +58,12 @@ CACHE_DIR_PATH = os.environ.get("CACHE_DIR", "cache")
 CACHE_DIR = Path(CACHE_DIR_PATH)
 CACHE_DIR.mkdir(exist_ok=True)
 
+# Most recently used cache entries kept in memory in front of the disk cache,
+# guarded by a lock because features are fetched from worker threads
+_MEM_CACHE: OrderedDict = OrderedDict()
+_MEM_MAX = 32
+_MEM_LOCK = threading.Lock()
+
 THEMES_DIR = "themes"
 FONTS_DIR = "fonts"
 POSTERS_DIR = "posters"
@@ -49,25 +72,55 @@ FILE_ENCODING = "utf-8"
 
 FONTS = load_fonts()
 
+# OSM tags of the feature layers drawn under the roads
+WATER_TAGS = {"natural": ["water", "bay", "strait"], "waterway": "riverbank"}
+PARKS_TAGS = {"leisure": "park", "landuse": "grass"}
+
+# GEOS geometry type ids for Polygon and MultiPolygon (see shapely.get_type_id)
+POLYGON_TYPE_IDS = (3, 6)
+
+# Reusable figures keyed by (width, height) in inches, see get_figure()
+_FIGURES: dict = {}
+
+# Sorted theme names, invalidated when the themes directory mtime changes
+_THEMES_CACHE: dict = {"mtime": None, "names": frozenset(), "sorted": ()}
 
-def _cache_path(key: str) -> str:
+
+def _cache_path(key: str, ext: str = ".pkl") -> str:
     """
     Generate a safe cache file path from a cache key.
 
     Args:
         key: Cache key identifier
+        ext: File extension for the cache entry (default: .pkl)
 
     Returns:
-        Path to cache file with .pkl extension
+        Path to cache file with the given extension
     """
     safe = key.replace(os.sep, "_")
-    return os.path.join(CACHE_DIR, f"{safe}.pkl")
+    return os.path.join(CACHE_DIR, f"{safe}{ext}")
+
+
+def _mem_cache_put(key: str, value) -> None:
+    """Insert an entry into the in-memory cache, evicting the oldest ones."""
+    with _MEM_LOCK:
+        _MEM_CACHE[key] = value
+        _MEM_CACHE.move_to_end(key)
+        while len(_MEM_CACHE) > _MEM_MAX:
+            _MEM_CACHE.popitem(last=False)
 
 
 def cache_get(key: str):
     """
     Retrieve a cached object by key.
 
+    Recently used entries are served from memory; on a miss the disk cache
+    is read and the result kept in memory. GeoDataFrames stored as
+    GeoParquet are read first when ``pyarrow`` is installed, then plain
+    data stored as JSON. Otherwise prefers the zstd-compressed pickle when
+    the optional ``zstandard`` package is installed, falling back to a
+    plain pickle written by older versions.
+
     Args:
         key: Cache key identifier
 
@@ -77,8 +130,30 @@ def cache_get(key: str):
     Raises:
         CacheError: If cache read operation fails
     """
+    with _MEM_LOCK:
+        if key in _MEM_CACHE:
+            _MEM_CACHE.move_to_end(key)
+            return _MEM_CACHE[key]
+    value = _cache_read(key)
+    if value is not None:
+        _mem_cache_put(key, value)
+    return value
+
+
+def _cache_read(key: str):
+    """Read a cached object from disk, see cache_get()."""
     try:
+        parquet_path = _cache_path(key, ".parquet")
+        if PARQUET_AVAILABLE and os.path.exists(parquet_path):
+            return read_parquet(parquet_path)
+        json_path = _cache_path(key, ".json")
+        if os.path.exists(json_path):
+            with open(json_path, "r", encoding=FILE_ENCODING) as f:
+                return json.load(f)
         path = _cache_path(key)
+        if zstandard is not None and os.path.exists(path + ".zst"):
+            with open(path + ".zst", "rb") as f:
+                return pickle.load(zstandard.ZstdDecompressor().stream_reader(f))
         if not os.path.exists(path):
             return None
         with open(path, "rb") as f:
@@ -87,10 +162,35 @@ def cache_get(key: str):
         raise CacheError(f"Cache read failed: {e}") from e
 
 
+def _cache_set_parquet(key: str, value: GeoDataFrame) -> bool:
+    """
+    Store a GeoDataFrame as zstd-compressed GeoParquet.
+
+    Returns:
+        True if written, False if the frame has columns Parquet cannot encode
+    """
+    path = _cache_path(key, ".parquet")
+    try:
+        value.to_parquet(path, compression="zstd")
+        return True
+    except Exception:
+        # Mixed-type OSM tag columns can be rejected by Arrow; drop any
+        # partial file so cache_get never reads it, and pickle instead.
+        if os.path.exists(path):
+            os.remove(path)
+        return False
+
+
 def cache_set(key: str, value):
     """
     Store an object in the cache.
 
+    The object is written to disk and kept in the in-memory cache.
+    GeoDataFrames are written as GeoParquet when ``pyarrow`` is installed,
+    and tuples of plain numbers/strings (e.g. coordinates) as JSON, which
+    reads back as a list. Everything else is pickled, zstd-compressed
+    (level 3) when the optional ``zstandard`` package is installed.
+
     Args:
         key: Cache key identifier
         value: Object to cache (must be picklable)
@@ -101,13 +201,43 @@ def cache_set(key: str, value):
     try:
         if not os.path.exists(CACHE_DIR):
             os.makedirs(CACHE_DIR)
+        _mem_cache_put(key, value)
+        if PARQUET_AVAILABLE and isinstance(value, GeoDataFrame):
+            if _cache_set_parquet(key, value):
+                return
+        if isinstance(value, tuple) and all(isinstance(v, (int, float, str)) for v in value):
+            with open(_cache_path(key, ".json"), "w", encoding=FILE_ENCODING) as f:
+                json.dump(value, f)
+            return
         path = _cache_path(key)
+        if zstandard is not None:
+            # Stream through the compressor so the uncompressed pickle is
+            # never held in memory as a whole
+            with open(path + ".zst", "wb") as f, zstandard.ZstdCompressor(level=3).stream_writer(f) as writer:
+                pickle.dump(value, writer, protocol=pickle.HIGHEST_PROTOCOL)
+            return
         with open(path, "wb") as f:
             pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
     except Exception as e:
         raise CacheError(f"Cache write failed: {e}") from e
 
 
+def cache_exists(key: str) -> bool:
+    """
+    Check whether an entry for key is stored on disk in a readable format.
+
+    Only the disk cache is consulted, since worker processes do not share
+    the in-memory cache.
+    """
+    path = _cache_path(key)
+    return (
+        (PARQUET_AVAILABLE and os.path.exists(_cache_path(key, ".parquet")))
+        or os.path.exists(_cache_path(key, ".json"))
+        or (zstandard is not None and os.path.exists(path + ".zst"))
+        or os.path.exists(path)
+    )
+
+
 # Font loading now handled by font_management.py module
 
 
@@ -158,20 +288,80 @@ def generate_output_filename(city, theme_name, output_format):
     return os.path.join(POSTERS_DIR, filename)
 
 
+def _scan_themes():
+    """
+    Return the theme cache, rescanning the themes directory only when its
+    mtime has changed since the last scan.
+
+    The sorted name list is built lazily, since membership checks only
+    need the set.
+    """
+    try:
+        mtime = os.stat(THEMES_DIR).st_mtime_ns
+    except FileNotFoundError:
+        os.makedirs(THEMES_DIR)
+        return {"mtime": None, "names": frozenset(), "sorted": ()}
+
+    if _THEMES_CACHE["mtime"] != mtime:
+        with os.scandir(THEMES_DIR) as entries:
+            names = frozenset(
+                entry.name[:-5]  # Remove .json extension
+                for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            )
+        _THEMES_CACHE["mtime"] = mtime
+        _THEMES_CACHE["names"] = names
+        _THEMES_CACHE["sorted"] = None
+
+    return _THEMES_CACHE
+
+
 def get_available_themes():
     """
     Scans the themes directory and returns a list of available theme names.
+
+    The result is cached against the directory's mtime, so repeated calls
+    cost a single stat() until a theme file is added or removed.
     """
-    if not os.path.exists(THEMES_DIR):
-        os.makedirs(THEMES_DIR)
-        return []
+    cache = _scan_themes()
+    if cache["sorted"] is None:
+        cache["sorted"] = tuple(sorted(cache["names"]))
+    return list(cache["sorted"])
 
-    themes = []
-    for file in sorted(os.listdir(THEMES_DIR)):
-        if file.endswith(".json"):
-            theme_name = file[:-5]  # Remove .json extension
-            themes.append(theme_name)
-    return themes
+
+def theme_exists(theme_name):
+    """
+    Check whether a theme with the given name exists in the themes directory.
+    """
+    return theme_name in _scan_themes()["names"]
+
+
+# Embedded terracotta theme, used when a theme file is missing
+DEFAULT_THEME = {
+    "name": "Terracotta",
+    "description": "Mediterranean warmth - burnt orange and clay tones on cream",
+    "bg": "#F5EDE4",
+    "text": "#8B4513",
+    "gradient_color": "#F5EDE4",
+    "water": "#A8C4C4",
+    "parks": "#E8E0D0",
+    "road_motorway": "#A0522D",
+    "road_primary": "#B8653A",
+    "road_secondary": "#C9846A",
+    "road_tertiary": "#D9A08A",
+    "road_residential": "#E5C4B0",
+    "road_default": "#D9A08A",
+}
+
+
+@lru_cache(maxsize=64)
+def _read_theme_file(theme_file, mtime_ns):
+    """
+    Parse a theme JSON file. Cached per (path, mtime), so an edited theme
+    file is re-read while unchanged ones are parsed only once.
+    """
+    with open(theme_file, "r", encoding=FILE_ENCODING) as f:
+        return json.load(f)
 
 
 def load_theme(theme_name="terracotta"):
@@ -180,61 +370,73 @@ def load_theme(theme_name="terracotta"):
     """
     theme_file = os.path.join(THEMES_DIR, f"{theme_name}.json")
 
-    if not os.path.exists(theme_file):
+    try:
+        mtime = os.stat(theme_file).st_mtime_ns
+    except FileNotFoundError:
         print(f"⚠ Theme file '{theme_file}' not found. Using default terracotta theme.")
         # Fallback to embedded terracotta theme
-        return {
-            "name": "Terracotta",
-            "description": "Mediterranean warmth - burnt orange and clay tones on cream",
-            "bg": "#F5EDE4",
-            "text": "#8B4513",
-            "gradient_color": "#F5EDE4",
-            "water": "#A8C4C4",
-            "parks": "#E8E0D0",
-            "road_motorway": "#A0522D",
-            "road_primary": "#B8653A",
-            "road_secondary": "#C9846A",
-            "road_tertiary": "#D9A08A",
-            "road_residential": "#E5C4B0",
-            "road_default": "#D9A08A",
-        }
+        return dict(DEFAULT_THEME)
 
-    with open(theme_file, "r", encoding=FILE_ENCODING) as f:
-        theme = json.load(f)
-        print(f"✓ Loaded theme: {theme.get('name', theme_name)}")
-        if "description" in theme:
-            print(f"  {theme['description']}")
-        return theme
+    # Copy so callers can't modify the cached theme
+    theme = dict(_read_theme_file(theme_file, mtime))
+    print(f"✓ Loaded theme: {theme.get('name', theme_name)}")
+    if "description" in theme:
+        print(f"  {theme['description']}")
+    return theme
 
 
 # Load theme (can be changed via command line or input)
 THEME = dict[str, str]()  # Will be loaded later
 
 
-def create_gradient_fade(ax, color, location="bottom", zorder=10):
+@lru_cache(maxsize=64)
+def _fp(fname, size):
     """
-    Creates a fade effect at the top or bottom of the map.
+    Return a FontProperties for a font file at the given size.
+    Cached; text artists copy the properties they are given, so sharing is safe.
     """
-    vals = np.linspace(0, 1, 256).reshape(-1, 1)
-    gradient = np.hstack((vals, vals))
+    return FontProperties(fname=fname, size=size)
 
-    rgb = mcolors.to_rgb(color)
+
+@lru_cache(maxsize=64)
+def _fp_family(family, weight, size):
+    """Return a cached FontProperties for a generic font family, see _fp()."""
+    return FontProperties(family=family, weight=weight, size=size)
+
+
+# Vertical 0..1 ramp shared by every gradient fade; the colormap supplies color and alpha.
+# A single column is enough, imshow stretches it across the axes width.
+_GRADIENT = np.linspace(0, 1, 256).reshape(-1, 1)
+
+
+@lru_cache(maxsize=64)
+def _gradient_cmap(rgb, location):
+    """
+    Build the fade colormap for an RGB triple and location ("bottom" or "top").
+    Cached, since each theme reuses the same color for every poster.
+    """
     my_colors = np.zeros((256, 4))
-    my_colors[:, 0] = rgb[0]
-    my_colors[:, 1] = rgb[1]
-    my_colors[:, 2] = rgb[2]
+    my_colors[:, :3] = rgb
 
     if location == "bottom":
         my_colors[:, 3] = np.linspace(1, 0, 256)
+    else:
+        my_colors[:, 3] = np.linspace(0, 1, 256)
+
+    return mcolors.ListedColormap(my_colors)
+
+
+def create_gradient_fade(ax, color, location="bottom", zorder=10):
+    """
+    Creates a fade effect at the top or bottom of the map.
+    """
+    if location == "bottom":
         extent_y_start = 0
         extent_y_end = 0.25
     else:
-        my_colors[:, 3] = np.linspace(0, 1, 256)
         extent_y_start = 0.75
         extent_y_end = 1.0
 
-    custom_cmap = mcolors.ListedColormap(my_colors)
-
     xlim = ax.get_xlim()
     ylim = ax.get_ylim()
     y_range = ylim[1] - ylim[0]
@@ -243,47 +445,92 @@ def create_gradient_fade(ax, color, location="bottom", zorder=10):
     y_top = ylim[0] + y_range * extent_y_end
 
     ax.imshow(
-        gradient,
+        _GRADIENT,
         extent=[xlim[0], xlim[1], y_bottom, y_top],
         aspect="auto",
-        cmap=custom_cmap,
+        cmap=_gradient_cmap(mcolors.to_rgb(color), location),
         zorder=zorder,
         origin="lower",
     )
 
 
-def get_edge_colors_by_type(g):
-    """
-    Assigns colors to edges based on road type hierarchy.
-    Returns a list of colors corresponding to each edge in the graph.
+def _polygon_collection(geoms, facecolor, zorder):
     """
-    edge_colors = []
-
-    for _u, _v, data in g.edges(data=True):
-        # Get the highway type (can be a list or string)
-        highway = data.get('highway', 'unclassified')
+    Build a single PathCollection for a GeoSeries of (Multi)Polygons.
 
+    Each polygon becomes one compound path (exterior plus interior rings,
+    so lakes keep their islands), avoiding the per-polygon PathPatch
+    artists that GeoSeries.plot creates.
+    """
+    paths = []
+    for geom in geoms:
+        polygons = geom.geoms if geom.geom_type == "MultiPolygon" else (geom,)
+        for poly in polygons:
+            if poly.is_empty:
+                continue
+            paths.append(
+                MplPath.make_compound_path(
+                    MplPath(np.asarray(poly.exterior.coords)[:, :2]),
+                    *[MplPath(np.asarray(ring.coords)[:, :2]) for ring in poly.interiors],
+                )
+            )
+    return PathCollection(paths, facecolors=facecolor, edgecolors="none", zorder=zorder)
+
+
+# Road hierarchy classes, indexed by the values of HIGHWAY_CLASSES.
+# Each class maps to a "road_<class>" theme color and a line width.
+ROAD_CLASSES = ("motorway", "primary", "secondary", "tertiary", "residential", "default")
+ROAD_WIDTHS = np.array([1.2, 1.0, 0.8, 0.6, 0.4, 0.4])
+DEFAULT_ROAD_CLASS = ROAD_CLASSES.index("default")
+
+HIGHWAY_CLASSES = {
+    "motorway": 0,
+    "motorway_link": 0,
+    "trunk": 1,
+    "trunk_link": 1,
+    "primary": 1,
+    "primary_link": 1,
+    "secondary": 2,
+    "secondary_link": 2,
+    "tertiary": 3,
+    "tertiary_link": 3,
+    "residential": 4,
+    "living_street": 4,
+    "unclassified": 4,
+}
+
+
+def get_edge_road_classes(g):
+    """
+    Classifies every edge into a road hierarchy class.
+    Returns an integer array of indices into ROAD_CLASSES, in edge order.
+    """
+    classes = []
+    for _u, _v, highway in g.edges(data="highway", default="unclassified"):
         # Handle list of highway types (take the first one)
         if isinstance(highway, list):
-            highway = highway[0] if highway else 'unclassified'
-
-        # Assign color based on road type
-        if highway in ["motorway", "motorway_link"]:
-            color = THEME["road_motorway"]
-        elif highway in ["trunk", "trunk_link", "primary", "primary_link"]:
-            color = THEME["road_primary"]
-        elif highway in ["secondary", "secondary_link"]:
-            color = THEME["road_secondary"]
-        elif highway in ["tertiary", "tertiary_link"]:
-            color = THEME["road_tertiary"]
-        elif highway in ["residential", "living_street", "unclassified"]:
-            color = THEME["road_residential"]
-        else:
-            color = THEME['road_default']
+            highway = highway[0] if highway else "unclassified"
+        classes.append(HIGHWAY_CLASSES.get(highway, DEFAULT_ROAD_CLASS))
+
+    return np.array(classes, dtype=np.intp)
 
-        edge_colors.append(color)
 
-    return edge_colors
+def compute_edge_styles(g):
+    """
+    Assigns colors and line widths to edges based on road type hierarchy.
+    Walks the graph's edges once and returns (colors, widths) lists, in edge order.
+    """
+    road_classes = get_edge_road_classes(g)
+    palette = np.array([THEME[f"road_{name}"] for name in ROAD_CLASSES], dtype=object)
+    return palette[road_classes].tolist(), ROAD_WIDTHS[road_classes].tolist()
+
+
+def get_edge_colors_by_type(g):
+    """
+    Assigns colors to edges based on road type hierarchy.
+    Returns a list of colors corresponding to each edge in the graph.
+    """
+    return compute_edge_styles(g)[0]
 
 
 def get_edge_widths_by_type(g):
@@ -291,29 +538,24 @@ def get_edge_widths_by_type(g):
     Assigns line widths to edges based on road type.
     Major roads get thicker lines.
     """
-    edge_widths = []
+    return compute_edge_styles(g)[1]
 
-    for _u, _v, data in g.edges(data=True):
-        highway = data.get('highway', 'unclassified')
 
-        if isinstance(highway, list):
-            highway = highway[0] if highway else 'unclassified'
-
-        # Assign width based on road importance
-        if highway in ["motorway", "motorway_link"]:
-            width = 1.2
-        elif highway in ["trunk", "trunk_link", "primary", "primary_link"]:
-            width = 1.0
-        elif highway in ["secondary", "secondary_link"]:
-            width = 0.8
-        elif highway in ["tertiary", "tertiary_link"]:
-            width = 0.6
+def get_edge_segments(g):
+    """
+    Returns one (n, 2) coordinate array per edge, in edge order.
+    Edges without a geometry are drawn as a straight line between their nodes.
+    """
+    nodes = g.nodes
+    segments = []
+    for u, v, geom in g.edges(data="geometry"):
+        if geom is None:
+            segments.append(
+                ((nodes[u]["x"], nodes[u]["y"]), (nodes[v]["x"], nodes[v]["y"]))
+            )
         else:
-            width = 0.4
-
-        edge_widths.append(width)
-
-    return edge_widths
+            segments.append(np.asarray(geom.coords)[:, :2])
+    return segments
 
 
 def get_coordinates(city, country):
@@ -325,7 +567,7 @@ def get_coordinates(city, country):
     cached = cache_get(coords)
     if cached:
         print(f"✓ Using cached coordinates for {city}, {country}")
-        return cached
+        return tuple(cached)
 
     print("Looking up coordinates...")
     geolocator = Nominatim(user_agent="city_map_poster", timeout=10)
@@ -429,8 +671,6 @@ def fetch_graph(point, dist) -> MultiDiGraph | None:
 
     try:
         g = ox.graph_from_point(point, dist=dist, dist_type='bbox', network_type='all', truncate_by_edge=True)
-        # Rate limit between requests
-        time.sleep(0.5)
         try:
             cache_set(graph, g)
         except CacheError as e:
@@ -441,6 +681,51 @@ def fetch_graph(point, dist) -> MultiDiGraph | None:
         return None
 
 
+def _graph_proj_cache_key(point, dist):
+    """Cache key of the projected street network, see fetch_projected_graph()."""
+    lat, lon = point
+    return f"graph_proj_{lat}_{lon}_{dist}"
+
+
+def _features_cache_key(point, dist, tags, name):
+    """Cache key of a feature layer, see fetch_features()."""
+    lat, lon = point
+    tag_str = "_".join(tags.keys())
+    return f"{name}_{lat}_{lon}_{dist}_{tag_str}"
+
+
+def fetch_projected_graph(point, dist) -> MultiDiGraph | None:
+    """
+    Fetch the street network graph projected to its local UTM CRS.
+
+    Projection walks every node through pyproj, so the projected graph is
+    cached separately from the raw download and reused on later runs.
+
+    Args:
+        point: (latitude, longitude) tuple for center point
+        dist: Distance in meters from center point
+
+    Returns:
+        Projected MultiDiGraph of street network, or None if fetch fails
+    """
+    graph_proj = _graph_proj_cache_key(point, dist)
+    cached = cache_get(graph_proj)
+    if cached is not None:
+        print("✓ Using cached projected street network")
+        return cast(MultiDiGraph, cached)
+
+    g = fetch_graph(point, dist)
+    if g is None:
+        return None
+
+    g_proj = ox.project_graph(g)
+    try:
+        cache_set(graph_proj, g_proj)
+    except CacheError as e:
+        print(e)
+    return g_proj
+
+
 def fetch_features(point, dist, tags, name) -> GeoDataFrame | None:
     """
     Fetch geographic features (water, parks, etc.) from OpenStreetMap.
@@ -457,9 +742,7 @@ def fetch_features(point, dist, tags, name) -> GeoDataFrame | None:
     Returns:
         GeoDataFrame of features, or None if fetch fails
     """
-    lat, lon = point
-    tag_str = "_".join(tags.keys())
-    features = f"{name}_{lat}_{lon}_{dist}_{tag_str}"
+    features = _features_cache_key(point, dist, tags, name)
     cached = cache_get(features)
     if cached is not None:
         print(f"✓ Using cached {name}")
@@ -467,8 +750,6 @@ def fetch_features(point, dist, tags, name) -> GeoDataFrame | None:
 
     try:
         data = ox.features_from_point(point, tags=tags, dist=dist)
-        # Rate limit between requests
-        time.sleep(0.3)
         try:
             cache_set(features, data)
         except CacheError as e:
@@ -479,6 +760,46 @@ def fetch_features(point, dist, tags, name) -> GeoDataFrame | None:
         return None
 
 
+def get_figure(width, height):
+    """
+    Return an empty figure of the given size in inches.
+
+    Figures are kept per size and cleared after each poster, so batch runs
+    (e.g. --all-themes) reuse the figure and its raster canvas instead of
+    allocating new ones for every theme.
+    """
+    fig = _FIGURES.get((width, height))
+    if fig is None:
+        fig = plt.figure(figsize=(width, height))
+        _FIGURES[(width, height)] = fig
+    else:
+        # Normally already cleared by create_poster; guards against a failed render
+        fig.clf()
+    return fig
+
+
+def compensated_distance(dist, width, height):
+    """
+    Return the fetch radius for a poster: the map data is fetched for a
+    square area and then cropped to the poster's aspect ratio.
+    """
+    return dist * (max(height, width) / min(height, width)) / 4  # To compensate for viewport crop
+
+
+def map_data_cached(point, dist, width=12, height=16):
+    """
+    Check whether the street network and every feature layer of a poster
+    are in the disk cache, so rendering it makes no Overpass requests.
+    """
+    compensated_dist = compensated_distance(dist, width, height)
+    keys = [
+        _graph_proj_cache_key(point, compensated_dist),
+        _features_cache_key(point, compensated_dist, WATER_TAGS, "water"),
+        _features_cache_key(point, compensated_dist, PARKS_TAGS, "parks"),
+    ]
+    return all(cache_exists(key) for key in keys)
+
+
 def create_poster(
     city,
     country,
@@ -522,91 +843,110 @@ def create_poster(
 
     print(f"\nGenerating map for {city}, {country}...")
 
+    compensated_dist = compensated_distance(dist, width, height)
+
     # Progress bar for data fetching
     with tqdm(
         total=3,
         desc="Fetching map data",
         unit="step",
         bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt}",
-    ) as pbar:
+    ) as pbar, ThreadPoolExecutor(max_workers=1) as executor:
+        # The Overpass queries are independent and I/O-bound, so the feature
+        # layers download one after the other in a background thread alongside
+        # the graph. A single worker keeps at most two queries in flight, which
+        # is the public server's per-IP slot limit; osmnx's slot check does not
+        # account for requests sent concurrently from other threads.
+        water_future = executor.submit(
+            fetch_features,
+            point,
+            compensated_dist,
+            tags=WATER_TAGS,
+            name="water",
+        )
+        parks_future = executor.submit(
+            fetch_features,
+            point,
+            compensated_dist,
+            tags=PARKS_TAGS,
+            name="parks",
+        )
+
         # 1. Fetch Street Network
         pbar.set_description("Downloading street network")
-        compensated_dist = dist * (max(height, width) / min(height, width)) / 4  # To compensate for viewport crop
-        g = fetch_graph(point, compensated_dist)
-        if g is None:
+        g_proj = fetch_projected_graph(point, compensated_dist)
+        if g_proj is None:
             raise RuntimeError("Failed to retrieve street network data.")
         pbar.update(1)
 
         # 2. Fetch Water Features
         pbar.set_description("Downloading water features")
-        water = fetch_features(
-            point,
-            compensated_dist,
-            tags={"natural": ["water", "bay", "strait"], "waterway": "riverbank"},
-            name="water",
-        )
+        water = water_future.result()
         pbar.update(1)
 
         # 3. Fetch Parks
         pbar.set_description("Downloading parks/green spaces")
-        parks = fetch_features(
-            point,
-            compensated_dist,
-            tags={"leisure": "park", "landuse": "grass"},
-            name="parks",
-        )
+        parks = parks_future.result()
         pbar.update(1)
 
     print("✓ All data retrieved successfully!")
 
     # 2. Setup Plot
     print("Rendering map...")
-    fig, ax = plt.subplots(figsize=(width, height), facecolor=THEME["bg"])
+    fig = get_figure(width, height)
+    fig.set_facecolor(THEME["bg"])
+    ax = fig.add_subplot()
     ax.set_facecolor(THEME["bg"])
     ax.set_position((0.0, 0.0, 1.0, 1.0))
 
-    # Project graph to a metric CRS so distances and aspect are linear (meters)
-    g_proj = ox.project_graph(g)
+    # The graph is projected to a metric CRS so distances and aspect are linear (meters)
+    target_crs = g_proj.graph["crs"]
+
+    # Determine cropping limits to maintain the poster aspect ratio
+    crop_xlim, crop_ylim = get_crop_limits(g_proj, point, fig, compensated_dist)
+    crop_box = box(crop_xlim[0], crop_ylim[0], crop_xlim[1], crop_ylim[1])
 
     # 3. Plot Layers
     # Layer 1: Polygons (filter to only plot polygon/multipolygon geometries, not points)
-    if water is not None and not water.empty:
-        # Filter to only polygon/multipolygon geometries to avoid point features showing as dots
-        water_polys = water[water.geometry.type.isin(["Polygon", "MultiPolygon"])]
-        if not water_polys.empty:
-            # Project water features in the same CRS as the graph
-            try:
-                water_polys = ox.projection.project_gdf(water_polys)
-            except Exception:
-                water_polys = water_polys.to_crs(g_proj.graph['crs'])
-            water_polys.plot(ax=ax, facecolor=THEME['water'], edgecolor='none', zorder=0.5)
-
-    if parks is not None and not parks.empty:
-        # Filter to only polygon/multipolygon geometries to avoid point features showing as dots
-        parks_polys = parks[parks.geometry.type.isin(["Polygon", "MultiPolygon"])]
-        if not parks_polys.empty:
-            # Project park features in the same CRS as the graph
-            try:
-                parks_polys = ox.projection.project_gdf(parks_polys)
-            except Exception:
-                parks_polys = parks_polys.to_crs(g_proj.graph['crs'])
-            parks_polys.plot(ax=ax, facecolor=THEME['parks'], edgecolor='none', zorder=0.8)
+    polygon_layers = {}
+    for name, features in (("water", water), ("parks", parks)):
+        if features is not None and not features.empty:
+            # Filter to only polygon/multipolygon geometries to avoid point features showing as dots
+            geoms = features.geometry
+            polys = geoms[np.isin(shapely.get_type_id(geoms.values), POLYGON_TYPE_IDS)]
+            if not polys.empty:
+                polygon_layers[name] = polys
+
+    if polygon_layers:
+        # Project all polygon layers into the graph's CRS in a single pass;
+        # only geometries are needed for drawing, so tag columns are dropped
+        projected = pd.concat(polygon_layers).to_crs(target_crs)
+
+        for name, zorder in (("water", 0.5), ("parks", 0.8)):
+            if name not in polygon_layers:
+                continue
+            # Clip to the visible window so huge coastal/ocean polygons don't get drawn in full
+            polys = clip(projected.loc[name], crop_box, keep_geom_type=True)
+            if not polys.empty:
+                ax.add_collection(_polygon_collection(polys, THEME[name], zorder))
+
     # Layer 2: Roads with hierarchy coloring
     print("Applying road hierarchy colors...")
-    edge_colors = get_edge_colors_by_type(g_proj)
-    edge_widths = get_edge_widths_by_type(g_proj)
-
-    # Determine cropping limits to maintain the poster aspect ratio
-    crop_xlim, crop_ylim = get_crop_limits(g_proj, point, fig, compensated_dist)
-    # Plot the projected graph and then apply the cropped limits
-    ox.plot_graph(
-        g_proj, ax=ax, bgcolor=THEME['bg'],
-        node_size=0,
-        edge_color=edge_colors,
-        edge_linewidth=edge_widths,
-        show=False,
-        close=False,
+    edge_colors, edge_widths = compute_edge_styles(g_proj)
+
+    # Draw every edge as one LineCollection and then apply the cropped limits
+    ax.add_collection(
+        LineCollection(
+            get_edge_segments(g_proj),
+            colors=edge_colors,
+            linewidths=edge_widths,
+            zorder=1,
+        )
     )
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+    ax.get_xaxis().set_visible(False)
+    ax.get_yaxis().set_visible(False)
     ax.set_aspect("equal", adjustable="box")
     ax.set_xlim(crop_xlim)
     ax.set_ylim(crop_ylim)
@@ -629,31 +969,21 @@ def create_poster(
     active_fonts = fonts or FONTS
     if active_fonts:
         # font_main is calculated dynamically later based on length
-        font_sub = FontProperties(
-            fname=active_fonts["light"], size=base_sub * scale_factor
-        )
-        font_coords = FontProperties(
-            fname=active_fonts["regular"], size=base_coords * scale_factor
-        )
-        font_attr = FontProperties(
-            fname=active_fonts["light"], size=base_attr * scale_factor
-        )
+        font_sub = _fp(active_fonts["light"], base_sub * scale_factor)
+        font_coords = _fp(active_fonts["regular"], base_coords * scale_factor)
+        font_attr = _fp(active_fonts["light"], base_attr * scale_factor)
     else:
         # Fallback to system fonts
-        font_sub = FontProperties(
-            family="monospace", weight="normal", size=base_sub * scale_factor
-        )
-        font_coords = FontProperties(
-            family="monospace", size=base_coords * scale_factor
-        )
-        font_attr = FontProperties(family="monospace", size=base_attr * scale_factor)
+        font_sub = _fp_family("monospace", "normal", base_sub * scale_factor)
+        font_coords = _fp_family("monospace", "normal", base_coords * scale_factor)
+        font_attr = _fp_family("monospace", "normal", base_attr * scale_factor)
 
     # Format city name based on script type
     # Latin scripts: apply uppercase and letter spacing for aesthetic
     # Non-Latin scripts (CJK, Thai, Arabic, etc.): no spacing, preserve case structure
     if is_latin_script(display_city):
         # Latin script: uppercase with letter spacing (e.g., "P  A  R  I  S")
-        spaced_city = "  ".join(list(display_city.upper()))
+        spaced_city = "  ".join(display_city.upper())
     else:
         # Non-Latin script: no spacing, no forced uppercase
         # For scripts like Arabic, Thai, Japanese, etc.
@@ -672,13 +1002,9 @@ def create_poster(
         adjusted_font_size = base_adjusted_main
 
     if active_fonts:
-        font_main_adjusted = FontProperties(
-            fname=active_fonts["bold"], size=adjusted_font_size
-        )
+        font_main_adjusted = _fp(active_fonts["bold"], adjusted_font_size)
     else:
-        font_main_adjusted = FontProperties(
-            family="monospace", weight="bold", size=adjusted_font_size
-        )
+        font_main_adjusted = _fp_family("monospace", "bold", adjusted_font_size)
 
     # --- BOTTOM TEXT ---
     ax.text(
@@ -735,9 +1061,9 @@ def create_poster(
 
     # --- ATTRIBUTION (bottom right) ---
     if FONTS:
-        font_attr = FontProperties(fname=FONTS["light"], size=8)
+        font_attr = _fp(FONTS["light"], 8)
     else:
-        font_attr = FontProperties(family="monospace", size=8)
+        font_attr = _fp_family("monospace", "normal", 8)
 
     ax.text(
         0.98,
@@ -766,12 +1092,30 @@ def create_poster(
     if fmt == "png":
         save_kwargs["dpi"] = 300
 
-    plt.savefig(output_file, format=fmt, **save_kwargs)
+    fig.savefig(output_file, format=fmt, **save_kwargs)
 
-    plt.close()
+    # Clear rather than close so the next poster of this size reuses the figure
+    fig.clf()
     print(f"✓ Done! Poster saved as {output_file}")
 
 
+def render_theme_poster(theme_name, city, country, point, dist, output_format, **poster_kwargs):
+    """
+    Load a theme and render one poster with it.
+
+    Module-level so it can run in a ProcessPoolExecutor worker for
+    parallel --all-themes batches.
+
+    Returns:
+        Path of the saved poster
+    """
+    global THEME
+    THEME = load_theme(theme_name)
+    output_file = generate_output_filename(city, theme_name, output_format)
+    create_poster(city, country, point, dist, output_file, output_format, **poster_kwargs)
+    return output_file
+
+
 def print_examples():
     """Print usage examples."""
     print("""
@@ -818,6 +1162,7 @@ Options:
   --country-label   Override country text displayed on poster
   --theme, -t       Theme name (default: terracotta)
   --all-themes      Generate posters for all themes
+  --jobs, -j        Themes to render in parallel with --all-themes (default: 1)
   --distance, -d    Map radius in meters (default: 18000)
   --list-themes     List all available themes
 
@@ -843,10 +1188,9 @@ def list_themes():
     for theme_name in available_themes:
         theme_path = os.path.join(THEMES_DIR, f"{theme_name}.json")
         try:
-            with open(theme_path, "r", encoding=FILE_ENCODING) as f:
-                theme_data = json.load(f)
-                display_name = theme_data.get('name', theme_name)
-                description = theme_data.get('description', '')
+            theme_data = _read_theme_file(theme_path, os.stat(theme_path).st_mtime_ns)
+            display_name = theme_data.get('name', theme_name)
+            description = theme_data.get('description', '')
         except (OSError, json.JSONDecodeError):
             display_name = theme_name
             description = ""
@@ -907,6 +1251,13 @@ Examples:
         action="store_true",
         help="Generate posters for all themes",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Number of themes to render in parallel with --all-themes (default: 1)",
+    )
     parser.add_argument(
         "--distance",
         "-d",
@@ -986,15 +1337,17 @@ Examples:
         )
         args.height = 20.0
 
-    available_themes = get_available_themes()
-    if not available_themes:
-        print("No themes found in 'themes/' directory.")
-        sys.exit(1)
-
     if args.all_themes:
-        themes_to_generate = available_themes
+        themes_to_generate = get_available_themes()
+        if not themes_to_generate:
+            print("No themes found in 'themes/' directory.")
+            sys.exit(1)
     else:
-        if args.theme not in available_themes:
+        if not theme_exists(args.theme):
+            available_themes = get_available_themes()
+            if not available_themes:
+                print("No themes found in 'themes/' directory.")
+                sys.exit(1)
             print(f"Error: Theme '{args.theme}' not found.")
             print(f"Available themes: {', '.join(available_themes)}")
             sys.exit(1)
@@ -1021,23 +1374,39 @@ Examples:
         else:
             coords = get_coordinates(args.city, args.country)
 
-        for theme_name in themes_to_generate:
-            THEME = load_theme(theme_name)
-            output_file = generate_output_filename(args.city, theme_name, args.format)
-            create_poster(
-                args.city,
-                args.country,
-                coords,
-                args.distance,
-                output_file,
-                args.format,
-                args.width,
-                args.height,
-                country_label=args.country_label,
-                display_city=args.display_city,
-                display_country=args.display_country,
-                fonts=custom_fonts,
-            )
+        poster_args = (args.city, args.country, coords, args.distance, args.format)
+        poster_kwargs = dict(
+            width=args.width,
+            height=args.height,
+            country_label=args.country_label,
+            display_city=args.display_city,
+            display_country=args.display_country,
+            fonts=custom_fonts,
+        )
+
+        # The first theme renders in-process and fills the map data cache,
+        # so parallel workers only ever read from it. If a download failed
+        # (or could not be cached), fall back to rendering serially rather
+        # than have every worker retry it against Overpass at once.
+        first_theme, *other_themes = themes_to_generate
+        render_theme_poster(first_theme, *poster_args, **poster_kwargs)
+
+        parallel = args.jobs > 1 and other_themes
+        if parallel and not map_data_cached(coords, args.distance, args.width, args.height):
+            print("⚠ Some map data is not cached, rendering remaining themes serially")
+            parallel = False
+
+        if parallel:
+            with ProcessPoolExecutor(max_workers=min(args.jobs, len(other_themes))) as executor:
+                futures = [
+                    executor.submit(render_theme_poster, theme_name, *poster_args, **poster_kwargs)
+                    for theme_name in other_themes
+                ]
+                for future in futures:
+                    future.result()
+        else:
+            for theme_name in other_themes:
+                render_theme_poster(theme_name, *poster_args, **poster_kwargs)
 
         print("\n" + "=" * 50)
         print("✓ Poster generation complete!")